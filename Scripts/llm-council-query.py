@@ -13,8 +13,10 @@ Usage:
 Requirements:
     - Python 3.8+
     - Environment variable OPENROUTER_API_KEY must be set
+    - Optional: orjson (faster --save-log writes)
 """
 
+import os
 import sys
 import json
 import time
@@ -23,32 +25,41 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
+
+# Only emit colors on an interactive terminal (and honor NO_COLOR)
+_USE_COLOR = sys.stdout.isatty() and os.environ.get('NO_COLOR') is None
+
+
 # ANSI color codes for terminal output
 class Colors:
-    HEADER = '\033[95m'
-    OKBLUE = '\033[94m'
-    OKCYAN = '\033[96m'
-    OKGREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
+    HEADER = '\033[95m' if _USE_COLOR else ''
+    OKBLUE = '\033[94m' if _USE_COLOR else ''
+    OKCYAN = '\033[96m' if _USE_COLOR else ''
+    OKGREEN = '\033[92m' if _USE_COLOR else ''
+    WARNING = '\033[93m' if _USE_COLOR else ''
+    FAIL = '\033[91m' if _USE_COLOR else ''
+    ENDC = '\033[0m' if _USE_COLOR else ''
+    BOLD = '\033[1m' if _USE_COLOR else ''
+    UNDERLINE = '\033[4m' if _USE_COLOR else ''
 
 
 def print_header(text: str):
     """Print a formatted header."""
     width = 70
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'═' * width}")
-    print(f"{text.center(width)}")
-    print(f"{'═' * width}{Colors.ENDC}\n")
+    rule = '═' * width
+    print(f"\n{Colors.HEADER}{Colors.BOLD}{rule}\n{text.center(width)}\n{rule}{Colors.ENDC}\n")
 
 
 def print_section(title: str, content: str = ""):
     """Print a formatted section."""
-    print(f"{Colors.OKCYAN}{Colors.BOLD}{title}{Colors.ENDC}")
+    text = f"{Colors.OKCYAN}{Colors.BOLD}{title}{Colors.ENDC}"
     if content:
-        print(f"{content}\n")
+        text += f"\n{content}\n"
+    print(text)
 
 
 def print_success(text: str):
@@ -74,11 +85,15 @@ def print_info(text: str):
 def save_to_log(data: Dict[str, Any], log_dir: Path):
     """Save query and response to timestamped log file."""
     log_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     log_file = log_dir / f"council_{timestamp}.json"
 
-    with open(log_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(log_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(log_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
 
     print_success(f"Saved to: {log_file}")
     return log_file
@@ -241,26 +256,29 @@ Examples:
         print_header("ALTERNATIVE EXECUTION METHODS")
 
         print_section("Method 1: Claude Code CLI (Recommended)")
-        print("  Open Claude Code and run:")
+        lines = ["  Open Claude Code and run:"]
         if args.stage1:
-            print(f'  > Use mcp__llm-council__council_stage1')
-            print(f'    question: "{args.question}"')
+            lines.append('  > Use mcp__llm-council__council_stage1')
+            lines.append(f'    question: "{args.question}"')
         else:
-            print(f'  > Use mcp__llm-council__council_query')
-            print(f'    question: "{args.question}"')
-            print(f'    save_conversation: {str(not args.no_save_conversation).lower()}')
+            lines.append('  > Use mcp__llm-council__council_query')
+            lines.append(f'    question: "{args.question}"')
+            lines.append(f'    save_conversation: {str(not args.no_save_conversation).lower()}')
+        print("\n".join(lines) + "\n")
 
-        print()
         print_section("Method 2: Direct Python Integration")
-        print("  See: https://github.com/anthropics/anthropic-sdk-python")
-        print("  Use Claude SDK with tool use + MCP server integration")
+        print("\n".join([
+            "  See: https://github.com/anthropics/anthropic-sdk-python",
+            "  Use Claude SDK with tool use + MCP server integration",
+        ]) + "\n")
 
-        print()
         print_section("Troubleshooting")
-        print("  • Timeouts in Qodo Gen? → Use Claude Code instead")
-        print("  • Need faster results? → Use --stage1 flag")
-        print("  • API errors? → Check OPENROUTER_API_KEY is set")
-        print("  • Network issues? → Increase --timeout value")
+        print("\n".join([
+            "  • Timeouts in Qodo Gen? → Use Claude Code instead",
+            "  • Need faster results? → Use --stage1 flag",
+            "  • API errors? → Check OPENROUTER_API_KEY is set",
+            "  • Network issues? → Increase --timeout value",
+        ]))
 
     except KeyboardInterrupt:
         print()
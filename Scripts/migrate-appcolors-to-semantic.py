@@ -25,13 +25,18 @@ Patterns Implemented:
     - Skips: AppColors.Budget.*, AppColors.Vendor.*, AppColors.Guest.*, AppColors.Avatar.*, AppColors.Task.*
 """
 
+import mmap
 import os
 import re
+import stat
 import sys
+import tempfile
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from functools import partial
+from typing import Iterator, List, Tuple
 
 # ============================================================================
 # CONFIGURATION
@@ -50,6 +55,8 @@ SKIP_PATTERNS = [
     "AppColors.Dashboard.",  # Dashboard-specific colors - don't migrate
 ]
 
+SKIP_PATTERNS_RE = re.compile("|".join(re.escape(p) for p in SKIP_PATTERNS))
+
 # ============================================================================
 # REPLACEMENT RULES
 # ============================================================================
@@ -249,6 +256,31 @@ OPACITY_MAPPINGS = {
     "0.95": "Opacity.strong",
 }
 
+# Every automatic replacement as (pattern, replacement): the direct mappings,
+# then the opacity variants of textPrimary, textSecondary and primary
+ALL_RULES: List[Tuple[str, str]] = [
+    (rule.pattern, rule.replacement) for rule in DIRECT_MAPPINGS
+] + [
+    (
+        rf"AppColors\.{color}\.opacity\({re.escape(opacity_val)}\)",
+        f"{semantic}.opacity({opacity_const})",
+    )
+    for color, semantic in (
+        ("textPrimary", "SemanticColors.textPrimary"),
+        ("textSecondary", "SemanticColors.textSecondary"),
+        ("primary", "SemanticColors.primaryAction"),
+    )
+    for opacity_val, opacity_const in OPACITY_MAPPINGS.items()
+]
+
+# All rules fused into one alternation so each line is scanned once.
+# Every pattern starts with "AppColors.", so matches never overlap and the
+# first rule listed still wins, exactly as with one re.sub per rule.
+COMBINED_RE = re.compile("|".join(
+    f"(?P<r{i}>{pattern})" for i, (pattern, _) in enumerate(ALL_RULES)
+))
+REPLACEMENTS = [replacement for _, replacement in ALL_RULES]
+
 # Colors that support opacity mappings
 COLORS_WITH_OPACITY = [
     ("textPrimary", "SemanticColors.textPrimary"),
@@ -266,6 +298,9 @@ COLORS_WITH_OPACITY = [
     ("divider", "SemanticColors.divider"),
 ]
 
+# Scan for AppColors references left over after the rules above
+REMAINING_APPCOLORS_RE = re.compile(r"AppColors\.\w+(?:\.\w+)*(?:\([^)\n]*\))?")
+
 # ============================================================================
 # MIGRATION LOGIC
 # ============================================================================
@@ -278,96 +313,95 @@ class MigrationResult:
     skipped_instances: List[Tuple[int, str, str]]  # (line_num, line_content, reason)
     errors: List[str]
 
-def should_skip_line(line: str) -> Optional[str]:
-    """Check if a line should be skipped. Returns reason if skip, None otherwise."""
-    for pattern in SKIP_PATTERNS:
-        if pattern in line:
-            return f"Contains {pattern} (domain-specific color)"
-    return None
+def _rule_replacement(match: re.Match) -> str:
+    """Return the replacement for whichever rule in COMBINED_RE matched."""
+    return REPLACEMENTS[int(match.lastgroup[1:])]
 
-def apply_direct_mappings(line: str) -> Tuple[str, int]:
-    """Apply direct color mappings to a line. Returns (new_line, count)."""
-    count = 0
-    for rule in DIRECT_MAPPINGS:
-        matches = len(re.findall(rule.pattern, line))
-        if matches > 0:
-            line = re.sub(rule.pattern, rule.replacement, line)
-            count += matches
-    return line, count
+def _line_bounds(content: str, pos: int) -> Tuple[int, int]:
+    """Return the (start, end) offsets of the line containing pos, excluding the newline."""
+    start = content.rfind("\n", 0, pos) + 1
+    end = content.find("\n", pos)
+    return start, len(content) if end == -1 else end
 
-def apply_opacity_mapping(line: str) -> Tuple[str, int, List[str]]:
+def migrate_content(content: str) -> Tuple[str, int, List[Tuple[int, str, str]]]:
     """
-    Apply opacity mappings to a line.
-    Returns (new_line, count, unhandled_patterns).
-    """
-    count = 0
-    unhandled = []
-    
-    # Pattern: AppColors.colorName.opacity(X.XX)
-    # Replace with: SemanticColors.colorName.opacity(Opacity.level)
+    Migrate the full text of a file in a single pass.
+    Returns (new_content, replacement_count, skipped_instances).
     
-    # Handle textPrimary with opacity
-    for opacity_val, opacity_const in OPACITY_MAPPINGS.items():
-        pattern = rf"AppColors\.textPrimary\.opacity\({opacity_val}\)"
-        if re.search(pattern, line):
-            line = re.sub(pattern, f"SemanticColors.textPrimary.opacity({opacity_const})", line)
-            count += 1
-    
-    # Handle textSecondary with opacity
-    for opacity_val, opacity_const in OPACITY_MAPPINGS.items():
-        pattern = rf"AppColors\.textSecondary\.opacity\({opacity_val}\)"
-        if re.search(pattern, line):
-            line = re.sub(pattern, f"SemanticColors.textSecondary.opacity({opacity_const})", line)
-            count += 1
-    
-    # Handle primary with opacity
-    for opacity_val, opacity_const in OPACITY_MAPPINGS.items():
-        pattern = rf"AppColors\.primary\.opacity\({opacity_val}\)"
-        if re.search(pattern, line):
-            line = re.sub(pattern, f"SemanticColors.primaryAction.opacity({opacity_const})", line)
-            count += 1
-    
-    # Check for any remaining AppColors.*.opacity patterns that weren't handled
-    remaining_opacity = re.findall(r"AppColors\.\w+\.opacity\([\d.]+\)", line)
-    for pattern in remaining_opacity:
-        if "SemanticColors" not in line or pattern in line:
-            unhandled.append(pattern)
-    
-    return line, count, unhandled
-
-def migrate_line(line: str, line_num: int) -> Tuple[str, int, Optional[Tuple[int, str, str]]]:
-    """
-    Migrate a single line.
-    Returns (new_line, replacement_count, skipped_info or None).
+    Lines containing a domain-specific color are copied through untouched;
+    the text between them is migrated with one COMBINED_RE.subn() call.
     """
-    # Check if line should be skipped
-    skip_reason = should_skip_line(line)
-    if skip_reason and "AppColors" in line:
-        return line, 0, (line_num, line.strip(), skip_reason)
-    
-    # Check if line contains AppColors at all
-    if "AppColors" not in line:
-        return line, 0, None
-    
+    pieces = []
+    skipped_starts = set()
+    flagged = []  # (offset in new content, line_content, reason)
     total_count = 0
-    
-    # Apply direct mappings first
-    line, direct_count = apply_direct_mappings(line)
-    total_count += direct_count
-    
-    # Apply opacity mappings
-    line, opacity_count, unhandled = apply_opacity_mapping(line)
-    total_count += opacity_count
-    
-    # Check for any remaining AppColors that weren't handled
-    if "AppColors" in line:
-        # Extract the specific pattern that wasn't handled
-        remaining = re.findall(r"AppColors\.\w+(?:\.\w+)*(?:\([^)]*\))?", line)
-        for pattern in remaining:
-            if "SemanticColors" not in pattern:
-                return line, total_count, (line_num, line.strip(), f"Unhandled pattern: {pattern}")
-    
-    return line, total_count, None
+    pos = 0
+    out_pos = 0
+    
+    # Copy skipped lines verbatim and migrate everything in between
+    for match in SKIP_PATTERNS_RE.finditer(content):
+        start, end = _line_bounds(content, match.start())
+        if start < pos:
+            continue  # Line was already skipped for an earlier match
+        migrated, count = COMBINED_RE.subn(_rule_replacement, content[pos:start])
+        total_count += count
+        out_pos += len(migrated)
+        skipped_starts.add(out_pos)
+        flagged.append((
+            out_pos,
+            content[start:end].strip(),
+            f"Contains {match.group(0)} (domain-specific color)"
+        ))
+        pieces.append(migrated)
+        pieces.append(content[start:end])
+        out_pos += end - start
+        pos = end
+    
+    migrated, count = COMBINED_RE.subn(_rule_replacement, content[pos:])
+    total_count += count
+    pieces.append(migrated)
+    new_content = "".join(pieces)
+    
+    # Flag the first AppColors reference left on each migrated line
+    last_start = -1
+    for match in REMAINING_APPCOLORS_RE.finditer(new_content):
+        start, end = _line_bounds(new_content, match.start())
+        if start == last_start or start in skipped_starts:
+            continue
+        if "SemanticColors" not in match.group(0):
+            last_start = start
+            flagged.append((
+                start,
+                new_content[start:end].strip(),
+                f"Unhandled pattern: {match.group(0)}"
+            ))
+    
+    # Replacements never add or remove newlines, so line numbers carry over
+    skipped = []
+    line_num = 1
+    line_pos = 0
+    for offset, line_content, reason in sorted(flagged, key=lambda item: item[0]):
+        line_num += new_content.count("\n", line_pos, offset)
+        line_pos = offset
+        skipped.append((line_num, line_content, reason))
+    
+    return new_content, total_count, skipped
+
+def write_file_atomically(file_path: Path, content: str) -> None:
+    """Replace a file's (or symlink target's) contents via a temp file, keeping its mode."""
+    target = Path(os.path.realpath(file_path))
+    tmp = tempfile.NamedTemporaryFile(
+        'w', encoding='utf-8', dir=target.parent, prefix=f".{target.name}.", suffix=".tmp",
+        delete=False
+    )
+    try:
+        with tmp:
+            tmp.write(content)
+        os.chmod(tmp.name, stat.S_IMODE(os.stat(target).st_mode))
+        os.replace(tmp.name, target)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
 
 def migrate_file(file_path: Path, dry_run: bool = False) -> MigrationResult:
     """Migrate a single file."""
@@ -380,46 +414,56 @@ def migrate_file(file_path: Path, dry_run: bool = False) -> MigrationResult:
     
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+            content = f.read()
     except Exception as e:
         result.errors.append(f"Failed to read file: {e}")
         return result
     
-    new_lines = []
-    for i, line in enumerate(lines, 1):
-        new_line, count, skipped = migrate_line(line, i)
-        new_lines.append(new_line)
-        result.replacements_made += count
-        if skipped:
-            result.skipped_instances.append(skipped)
+    # Nothing to migrate or report; skip the regex passes entirely
+    if "AppColors" not in content:
+        return result
+    
+    new_content, result.replacements_made, result.skipped_instances = migrate_content(content)
     
     # Write back if not dry run and changes were made
     if not dry_run and result.replacements_made > 0:
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.writelines(new_lines)
+            write_file_atomically(file_path, new_content)
         except Exception as e:
             result.errors.append(f"Failed to write file: {e}")
     
     return result
 
+def iter_swift_files(directory: Path) -> Iterator[Path]:
+    """Yield all Swift files under a directory, without following symlinks."""
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".swift"):
+                    yield Path(entry.path)
+
 def find_swift_files_with_appcolors(directory: Path) -> List[Path]:
     """Find all Swift files containing AppColors."""
     files = []
-    for swift_file in directory.rglob("*.swift"):
+    for swift_file in iter_swift_files(directory):
         try:
-            content = swift_file.read_text(encoding='utf-8')
-            if "AppColors." in content:
-                files.append(swift_file)
-        except Exception:
+            # Search the mapped bytes in place; no read copy, no decode
+            with open(swift_file, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(b"AppColors.") != -1:
+                        files.append(swift_file)
+        except (ValueError, OSError):
+            # ValueError: empty files can't be mapped (and can't match)
             pass
     return files
 
 def count_appcolors_instances(file_path: Path) -> int:
     """Count AppColors instances in a file."""
     try:
-        content = file_path.read_text(encoding='utf-8')
-        return len(re.findall(r"AppColors\.", content))
+        return file_path.read_bytes().count(b"AppColors.")
     except Exception:
         return 0
 
@@ -462,10 +506,11 @@ def main():
         print("Files containing AppColors:")
         print("-" * 70)
         files = find_swift_files_with_appcolors(VIEWS_DIR)
-        files.sort(key=lambda f: count_appcolors_instances(f), reverse=True)
+        counts = {f: count_appcolors_instances(f) for f in files}
+        files.sort(key=counts.__getitem__, reverse=True)
         total = 0
         for f in files:
-            count = count_appcolors_instances(f)
+            count = counts[f]
             total += count
             rel_path = f.relative_to(PROJECT_ROOT)
             print(f"  {count:3d} instances: {rel_path}")
@@ -492,27 +537,36 @@ def main():
     total_skipped = []
     files_modified = 0
     
-    for file_path in files:
-        before_count = count_appcolors_instances(file_path)
-        if before_count == 0:
-            continue
-        
-        result = migrate_file(file_path, dry_run=args.dry_run)
+    # Files are independent, so migrate them across all cores; migrate_file
+    # returns early for files without AppColors, so no pre-count is needed
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(
+            partial(migrate_file, dry_run=args.dry_run), files, chunksize=16
+        ))
+    
+    # Per-file lines are collected and written in one go after the loop
+    out_lines = []
+    for file_path, result in zip(files, results):
+        # Computed once per file and reused by the skipped summary below
+        if result.replacements_made > 0 or result.skipped_instances or result.errors:
+            rel_path = file_path.relative_to(PROJECT_ROOT)
         
         if result.replacements_made > 0:
             files_modified += 1
-            rel_path = file_path.relative_to(PROJECT_ROOT)
-            print(f"✓ {rel_path}")
-            print(f"  Replaced: {result.replacements_made} instances")
+            out_lines.append(f"✓ {rel_path}")
+            out_lines.append(f"  Replaced: {result.replacements_made} instances")
             total_replacements += result.replacements_made
         
         if result.skipped_instances:
             for line_num, line_content, reason in result.skipped_instances:
-                total_skipped.append((file_path, line_num, line_content, reason))
+                total_skipped.append((rel_path, line_num, line_content, reason))
         
         if result.errors:
             for error in result.errors:
-                print(f"  ✗ Error: {error}")
+                out_lines.append(f"✗ {rel_path}: {error}")
+    
+    if out_lines:
+        sys.stdout.write("\n".join(out_lines) + "\n")
     
     print()
     print("=" * 70)
@@ -528,11 +582,12 @@ def main():
         print("=" * 70)
         print("SKIPPED INSTANCES (require manual review)")
         print("=" * 70)
-        for file_path, line_num, line_content, reason in total_skipped:
-            rel_path = file_path.relative_to(PROJECT_ROOT)
-            print(f"\n📍 {rel_path}:{line_num}")
-            print(f"   Reason: {reason}")
-            print(f"   Line: {line_content[:100]}{'...' if len(line_content) > 100 else ''}")
+        out_lines = []
+        for rel_path, line_num, line_content, reason in total_skipped:
+            out_lines.append(f"\n📍 {rel_path}:{line_num}")
+            out_lines.append(f"   Reason: {reason}")
+            out_lines.append(f"   Line: {line_content[:100]}{'...' if len(line_content) > 100 else ''}")
+        sys.stdout.write("\n".join(out_lines) + "\n")
     
     print()
     if args.dry_run:
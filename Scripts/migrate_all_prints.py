@@ -5,7 +5,10 @@ Comprehensive script to migrate all print statements to AppLogger
 
 import re
 import os
+import stat
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Mapping of file patterns to logger categories
@@ -20,6 +23,30 @@ LOGGER_MAPPINGS = {
     'Document': 'AppLogger.storage',
 }
 
+# Emoji-prefixed prints, matched in one pass, and the logger level each becomes
+LOG_PRINT_RE = re.compile(r'print\("(?P<emoji>🔵|✅|❌|⚠️)[^"]*\]\s*(?P<message>[^"]+)"\)')
+LOG_LEVELS = {
+    '🔵': 'debug',
+    '✅': 'info',
+    '❌': 'error',
+    '⚠️': 'warning',
+}
+
+# Any line containing a print statement; MULTILINE so ^/$ bound each line
+PRINT_LINE_RE = re.compile(r'^.*print\(.*$', re.MULTILINE)
+
+# Messages printed by placeholder actions; these prints get commented out
+PLACEHOLDERS = [
+    'Add Task', 'New Note', 'Add Event', 'Add Guest',
+    'Call action', 'Email action', 'Schedule action', 'Share action',
+    'View details tapped', 'Browse vendors tapped', 'Venue tapped',
+    'Retry tapped', 'Dismissed', 'Generate mood board',
+    'Selected mood board', 'Selected chart', 'Selected palette',
+    'Search submitted', 'Importing', 'Saved guest', 'Saved expense',
+    'Saved category', 'Updated expense', 'Saved:', 'Saved vendor'
+]
+PLACEHOLDER_RE = re.compile('|'.join(map(re.escape, PLACEHOLDERS)))
+
 def get_logger_for_file(filepath):
     """Determine appropriate logger based on file path"""
     path_str = str(filepath)
@@ -37,22 +64,42 @@ def get_logger_for_file(filepath):
     else:
         return 'AppLogger.general'
 
+def _log_replacement(match):
+    """Build the logger call for an emoji-prefixed print match"""
+    level = LOG_LEVELS[match.group('emoji')]
+    return f'logger.{level}("{match.group("message")}")'
+
+def _migrate_print_line(match):
+    """Migrate a single line containing a print statement"""
+    line = match.group(0)
+    
+    # Skip if it's a placeholder print that should be removed
+    if should_remove_print(line):
+        # Comment it out instead of removing
+        return line.replace('print(', '// TODO: Implement action - print(', 1)
+    
+    # Migrate emoji-prefixed prints to the matching logger level
+    return LOG_PRINT_RE.sub(_log_replacement, line)
+
 def should_remove_print(line):
     """Determine if a print statement should be removed (placeholder actions)"""
-    placeholders = [
-        'Add Task', 'New Note', 'Add Event', 'Add Guest',
-        'Call action', 'Email action', 'Schedule action', 'Share action',
-        'View details tapped', 'Browse vendors tapped', 'Venue tapped',
-        'Retry tapped', 'Dismissed', 'Generate mood board',
-        'Selected mood board', 'Selected chart', 'Selected palette',
-        'Search submitted', 'Importing', 'Saved guest', 'Saved expense',
-        'Saved category', 'Updated expense', 'Saved:', 'Saved vendor'
-    ]
-    
-    for placeholder in placeholders:
-        if placeholder in line:
-            return True
-    return False
+    return PLACEHOLDER_RE.search(line) is not None
+
+def write_file_atomically(filepath, content):
+    """Replace a file's (or symlink target's) contents via a temp file, keeping its mode"""
+    target = Path(os.path.realpath(filepath))
+    tmp = tempfile.NamedTemporaryFile(
+        'w', dir=target.parent, prefix=f".{target.name}.", suffix=".tmp",
+        delete=False
+    )
+    try:
+        with tmp:
+            tmp.write(content)
+        os.chmod(tmp.name, stat.S_IMODE(os.stat(target).st_mode))
+        os.replace(tmp.name, target)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
 
 def migrate_file(filepath):
     """Migrate print statements in a single file"""
@@ -60,70 +107,30 @@ def migrate_file(filepath):
         with open(filepath, 'r') as f:
             content = f.read()
         
+        # Nothing to migrate without a print statement
+        if 'print(' not in content:
+            return False
+        
+        # Only placeholder and emoji-prefixed prints are ever rewritten
+        has_emoji = any(emoji in content for emoji in LOG_LEVELS)
+        if not has_emoji and PLACEHOLDER_RE.search(content) is None:
+            return False
+        
         original_content = content
         logger_name = get_logger_for_file(filepath)
         
-        # Check if logger already exists
-        has_logger = 'private let logger' in content or 'let logger' in content
-        
-        # Track if we made changes
-        changes_made = False
-        lines = content.split('\n')
-        new_lines = []
+        # Check if logger already exists ('let logger' also covers 'private let logger')
+        has_logger = 'let logger' in content
         
-        for i, line in enumerate(lines):
-            # Skip if it's a placeholder print that should be removed
-            if 'print(' in line and should_remove_print(line):
-                # Comment it out instead of removing
-                new_lines.append(line.replace('print(', '// TODO: Implement action - print('))
-                changes_made = True
-                continue
-            
-            # Migrate debug prints with emoji
-            if 'print("🔵' in line:
-                new_line = re.sub(r'print\("🔵[^"]*\]\s*([^"]+)"\)', r'logger.debug("\1")', line)
-                if new_line != line:
-                    new_lines.append(new_line)
-                    changes_made = True
-                    continue
-            
-            # Migrate success prints
-            if 'print("✅' in line:
-                new_line = re.sub(r'print\("✅[^"]*\]\s*([^"]+)"\)', r'logger.info("\1")', line)
-                if new_line != line:
-                    new_lines.append(new_line)
-                    changes_made = True
-                    continue
-            
-            # Migrate error prints
-            if 'print("❌' in line:
-                new_line = re.sub(r'print\("❌[^"]*\]\s*([^"]+)"\)', r'logger.error("\1")', line)
-                if new_line != line:
-                    new_lines.append(new_line)
-                    changes_made = True
-                    continue
-            
-            # Migrate warning prints
-            if 'print("⚠️' in line:
-                new_line = re.sub(r'print\("⚠️[^"]*\]\s*([^"]+)"\)', r'logger.warning("\1")', line)
-                if new_line != line:
-                    new_lines.append(new_line)
-                    changes_made = True
-                    continue
-            
-            new_lines.append(line)
+        # Rewrite only the lines containing a print statement, in one pass
+        content = PRINT_LINE_RE.sub(_migrate_print_line, content)
+        changes_made = content != original_content
         
         if changes_made:
-            content = '\n'.join(new_lines)
-            
             # Add logger if needed and changes were made
             if not has_logger and changes_made:
                 # Find appropriate place to add logger
                 if '@MainActor' in content:
-                    content = content.replace(
-                        '@MainActor\nfinal class',
-                        f'@MainActor\nfinal class'
-                    )
                     # Add after class declaration
                     content = re.sub(
                         r'(class\s+\w+[^{]*\{)',
@@ -140,8 +147,7 @@ def migrate_file(filepath):
                         count=1
                     )
             
-            with open(filepath, 'w') as f:
-                f.write(content)
+            write_file_atomically(filepath, content)
             
             return True
         
@@ -166,10 +172,18 @@ def main():
     
     migrated_count = 0
     
-    for filepath in swift_files:
-        if migrate_file(filepath):
+    # Files are independent, so migrate them across all cores
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(migrate_file, swift_files, chunksize=32))
+    
+    out_lines = []
+    for filepath, migrated in zip(swift_files, results):
+        if migrated:
             migrated_count += 1
-            print(f"✅ Migrated {filepath.name}")
+            out_lines.append(f"✅ Migrated {filepath.name}")
+    
+    if out_lines:
+        sys.stdout.write("\n".join(out_lines) + "\n")
     
     print(f"\n✅ Migration complete: {migrated_count} files updated")
 
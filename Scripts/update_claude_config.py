@@ -8,6 +8,18 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib parser
+    orjson = None
+
+def replace_env_key(servers, server, key, changes_made, change_label):
+    """Point servers[server]["env"][key] at ${key} unless it already is a reference."""
+    env = servers.get(server, {}).get("env", {})
+    if key in env and not env[key].startswith("${"):
+        env[key] = "${" + key + "}"
+        changes_made.append(change_label)
+
 def update_claude_config():
     """Update .claude.json to use environment variable references."""
     
@@ -18,8 +30,11 @@ def update_claude_config():
         sys.exit(1)
     
     # Read current config
-    with open(config_path, 'r') as f:
-        config = json.load(f)
+    if orjson is not None:
+        config = orjson.loads(config_path.read_bytes())
+    else:
+        with open(config_path, 'r') as f:
+            config = json.load(f)
     
     # Track changes
     changes_made = []
@@ -27,22 +42,12 @@ def update_claude_config():
     # Update global MCP servers
     if "mcpServers" in config:
         # ADR Analysis Server
-        if "adr-analysis" in config["mcpServers"]:
-            if "env" in config["mcpServers"]["adr-analysis"]:
-                if "OPENROUTER_API_KEY" in config["mcpServers"]["adr-analysis"]["env"]:
-                    old_value = config["mcpServers"]["adr-analysis"]["env"]["OPENROUTER_API_KEY"]
-                    if not old_value.startswith("${"):
-                        config["mcpServers"]["adr-analysis"]["env"]["OPENROUTER_API_KEY"] = "${OPENROUTER_API_KEY}"
-                        changes_made.append("adr-analysis: OPENROUTER_API_KEY")
+        replace_env_key(config["mcpServers"], "adr-analysis", "OPENROUTER_API_KEY",
+                        changes_made, "adr-analysis: OPENROUTER_API_KEY")
         
         # Greb MCP
-        if "greb-mcp" in config["mcpServers"]:
-            if "env" in config["mcpServers"]["greb-mcp"]:
-                if "GREB_API_KEY" in config["mcpServers"]["greb-mcp"]["env"]:
-                    old_value = config["mcpServers"]["greb-mcp"]["env"]["GREB_API_KEY"]
-                    if not old_value.startswith("${"):
-                        config["mcpServers"]["greb-mcp"]["env"]["GREB_API_KEY"] = "${GREB_API_KEY}"
-                        changes_made.append("greb-mcp: GREB_API_KEY")
+        replace_env_key(config["mcpServers"], "greb-mcp", "GREB_API_KEY",
+                        changes_made, "greb-mcp: GREB_API_KEY")
         
         # Swiftzilla - API key is in args, not env
         if "swiftzilla" in config["mcpServers"]:
@@ -68,13 +73,8 @@ def update_claude_config():
         for project_path, project_config in config["projects"].items():
             if "mcpServers" in project_config:
                 # ADR Analysis in project
-                if "adr-analysis" in project_config["mcpServers"]:
-                    if "env" in project_config["mcpServers"]["adr-analysis"]:
-                        if "OPENROUTER_API_KEY" in project_config["mcpServers"]["adr-analysis"]["env"]:
-                            old_value = project_config["mcpServers"]["adr-analysis"]["env"]["OPENROUTER_API_KEY"]
-                            if not old_value.startswith("${"):
-                                project_config["mcpServers"]["adr-analysis"]["env"]["OPENROUTER_API_KEY"] = "${OPENROUTER_API_KEY}"
-                                changes_made.append(f"Project {project_path}: adr-analysis OPENROUTER_API_KEY")
+                replace_env_key(project_config["mcpServers"], "adr-analysis", "OPENROUTER_API_KEY",
+                                changes_made, f"Project {project_path}: adr-analysis OPENROUTER_API_KEY")
     
     if not changes_made:
         print("✅ No hardcoded API keys found - config already uses environment variables")